@@ -1,37 +1,65 @@
 import os
-import re
+import pickle
+import hashlib
 import logging
-from functools import lru_cache
-from typing import List, Dict, Any, Tuple
-
-import pandas as pd
-from flask import Flask, request, jsonify, abort
-from flask_cors import CORS
+from functools import lru_cache, wraps
+from itertools import islice
+from typing import Awaitable, Callable, Dict, Any, FrozenSet, Iterable, List, Optional, Tuple
+
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+from starlette.applications import Starlette
+from starlette.exceptions import HTTPException
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
 
 # ── CONFIG ────────────────────────────────────────────────────────────────────
 CSV_PATH = os.getenv("CSV_PATH", "nlpearl_test_db.csv")
 CSV_SEP = ";"
+# Cells read as missing (-> ""): same list as pandas' default NA values
+CSV_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+# Pickled lookup maps, reused across restarts while the CSV is unchanged
+CACHE_PATH = os.getenv("CACHE_PATH", CSV_PATH + ".pkl")
+CACHE_VERSION = 3  # bump when the layout returned by load_data() changes
+# HTTP caching of lookup responses (the data only changes when the CSV is redeployed)
+CACHE_MAX_AGE = int(os.getenv("CACHE_MAX_AGE", 3600))
 PHONE_COL = os.getenv("PHONE_COL", "phone_number")
 CONTRACT_COL = os.getenv("CONTRACT_COL", "contract_code")
 DEFAULT_FIELDS = os.getenv(
     "DEFAULT_FIELDS",
     "contract_code,platform,status,average_arpu,service_type,activation_date,num_contact_tec,num_contact_amm,bb_active,user_name,admin_situation"
 ).split(",")
+# Columns served by the single-field endpoints, with the type they are returned as
+SINGLE_FIELD_COLS = {
+    "num_contact_tec": int,
+    "num_contact_amm": int,
+    "bb_active": int,
+    "user_name": str,
+}
 
 # ── LOGGING ────────────────────────────────────────────────────────────────────
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # ── PHONE NORMALIZATION ──────────────────────────────────────────────────────
-PHONE_REGEX = re.compile(r"^[\d\+]+$")  # basic check: digits and plus
+_PHONE_SEPARATORS = str.maketrans("", "", " -")
+_PHONE_CHARS = str.maketrans("", "", "0123456789+")  # basic check: digits and plus
 
 def normalize_phone(phone: str) -> str:
     """
     Normalizza il numero di telefono in formato +<country><number>
     Supporta input con 00, + o senza prefisso.
     """
-    phone = phone.strip().replace(" ", "").replace("-", "")
-    if not PHONE_REGEX.match(phone):
+    phone = phone.strip().translate(_PHONE_SEPARATORS)
+    if not phone or phone.translate(_PHONE_CHARS):
         return phone  # lascia com'è, fallback
 
     if phone.startswith("00"):
@@ -43,214 +71,363 @@ def normalize_phone(phone: str) -> str:
     # Fallback generico: aggiungi +
     return "+" + phone
 
+def normalize_phone_column(phones: pa.ChunkedArray) -> pa.ChunkedArray:
+    """
+    Vectorized `normalize_phone` for a whole CSV column (no per-row Python calls).
+    """
+    s = pc.replace_substring(pc.replace_substring(pc.utf8_trim_whitespace(phones), " ", ""), "-", "")
+    # "00..." -> "+...", "+..." invariato, altrimenti (39... o fallback) aggiungi +
+    normalized = pc.if_else(
+        pc.starts_with(s, "00"),
+        pc.binary_join_element_wise("+", pc.utf8_slice_codeunits(s, 2), ""),
+        pc.if_else(pc.starts_with(s, "+"), s, pc.binary_join_element_wise("+", s, "")),
+    )
+    return pc.if_else(pc.ascii_is_decimal(pc.replace_substring(s, "+", "")), normalized, s)
+
 # ── DATA LOADING ───────────────────────────────────────────────────────────────
+LoadedData = Tuple[
+    Dict[str, Dict[str, str]],
+    Dict[str, Dict[str, str]],
+    Dict[str, Dict[str, Any]],
+    Dict[str, Dict[str, Any]],
+    FrozenSet[str],
+]
+
+def _cache_key() -> Tuple[Any, ...]:
+    """Identify the CSV contents and the config the maps were built with."""
+    st = os.stat(CSV_PATH)
+    return (CACHE_VERSION, st.st_mtime_ns, st.st_size, PHONE_COL, CONTRACT_COL, tuple(DEFAULT_FIELDS))
+
+def _read_cache(key: Tuple[Any, ...]) -> Optional[LoadedData]:
+    """Return the pickled maps if they were built from the CSV identified by `key`, else None."""
+    try:
+        with open(CACHE_PATH, "rb") as f:
+            cached = pickle.load(f)
+        if cached["key"] == key:
+            return cached["data"]
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache {CACHE_PATH}: {e}")
+    return None
+
+def _write_cache(key: Tuple[Any, ...], data: LoadedData) -> None:
+    """Pickle the maps next to the CSV; failures only cost the next startup a CSV parse."""
+    tmp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"key": key, "data": data}, f, protocol=5)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError as e:
+        logger.warning(f"Could not write cache {CACHE_PATH}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
 @lru_cache(maxsize=1)
-def load_data() -> Tuple[pd.DataFrame, Dict[str, int], Dict[str, int]]:
+def load_data() -> Tuple[Tuple[Any, ...], LoadedData]:
     """
-    Load and cache the CSV data and build lookup indices with normalized phone numbers.
+    Load and cache the lookup maps, from the pickle cache when it matches the CSV,
+    otherwise by parsing the CSV (and refreshing the cache). Also returns the cache key
+    identifying the data version.
     """
+    # Stat the CSV before parsing: if it is replaced meanwhile, the key no longer matches
+    # on the next start instead of labelling old data with the new file's key
     try:
-        df = pd.read_csv(CSV_PATH, sep=CSV_SEP, dtype=str).fillna("")
+        key = _cache_key()
+    except FileNotFoundError:
+        raise RuntimeError(f"CSV file not found at {CSV_PATH}")
+    data = _read_cache(key)
+    if data is None:
+        data = _parse_csv()
+        _write_cache(key, data)
+        # The Arrow table is gone: hand its buffers back to the OS instead of keeping them pooled
+        pa.default_memory_pool().release_unused()
+    return key, data
+
+def _parse_int_column(values: pa.ChunkedArray) -> List[Optional[int]]:
+    """Vectorized `int(v or 0)` over a string column; cells that are not integers become None."""
+    values = pc.utf8_trim_whitespace(values)
+    values = pc.if_else(pc.equal(values, ""), "0", values)
+    valid = pc.match_substring_regex(values, r"^[+-]?\d+$")
+    values = pc.if_else(valid, values, pa.scalar(None, pa.string()))
+    # Arrow's int64 cast rejects a leading "+", int() does not
+    values = pc.replace_substring_regex(values, r"^\+", "")
+    try:
+        return pc.cast(values, pa.int64()).to_pylist()
+    except pa.ArrowInvalid:
+        # Out of int64 range: parse cell by cell like the baseline (all cells are valid digits here)
+        return [None if v is None else int(v) for v in values.to_pylist()]
 
-        # Normalize phone numbers in CSV
-        if PHONE_COL in df.columns:
-            df[PHONE_COL] = df[PHONE_COL].apply(normalize_phone)
+def _with_phone_variants(by_phone: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add the other input forms of each canonical +<number> phone (<number>, 00<number>),
+    so that most requests are answered without normalizing the URL segment.
+    """
+    expanded = dict(by_phone)
+    for phone, value in by_phone.items():
+        if phone.startswith("+"):
+            for variant in (phone[1:], "00" + phone[1:]):
+                # Only forms that normalize back to this phone (e.g. not "0039..." for "+0039...")
+                if normalize_phone(variant) == phone:
+                    expanded.setdefault(variant, value)
+    return expanded
+
+def _parse_csv() -> LoadedData:
+    """
+    Read the CSV and build phone/contract -> record maps with normalized phone numbers,
+    plus per-column contract/phone -> value maps for the single-field endpoints and the set of CSV columns.
+    """
+    try:
+        if os.path.getsize(CSV_PATH) == 0:
+            raise RuntimeError(f"CSV file at {CSV_PATH} is empty")
+
+        # Column names as pyarrow parses them (handles BOM and quoted headers)
+        parse_options = pacsv.ParseOptions(delimiter=CSV_SEP)
+        with pacsv.open_csv(CSV_PATH, parse_options=parse_options) as reader:
+            header = reader.schema.names
+
+        # Read every column as string (no type inference), missing values as ""
+        table = pacsv.read_csv(
+            CSV_PATH,
+            parse_options=parse_options,
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                null_values=CSV_NA_VALUES,
+                strings_can_be_null=True,
+            ),
+        )
+        names = table.column_names
 
         # Validate required columns exist
         required_cols = [PHONE_COL, CONTRACT_COL] + DEFAULT_FIELDS
-        missing_cols = [col for col in required_cols if col not in df.columns]
+        missing_cols = [col for col in required_cols if col not in names]
         if missing_cols:
             raise ValueError(f"Missing required columns: {', '.join(missing_cols)}")
 
+        cols = {name: pc.fill_null(table.column(name), "") for name in names}
+
+        # Normalize phone numbers in CSV
+        cols[PHONE_COL] = normalize_phone_column(cols[PHONE_COL])
+
+        # Parse the single-field values once (column-wise) instead of on every request
+        field_values = {
+            col: _parse_int_column(cols[col]) if col in cols else [0] * table.num_rows
+            for col, cast in SINGLE_FIELD_COLS.items() if cast is int
+        }
+
+        cols = {name: col.to_pylist() for name, col in cols.items()}
+
+        # String values reuse the records' str objects instead of keeping a second copy
+        field_values.update({
+            col: cols.get(col, [""] * table.num_rows)
+            for col, cast in SINGLE_FIELD_COLS.items() if cast is str
+        })
+
         # Overwrite row 50 (index 49) safely if exists
-        if len(df) > 49:
-            df.loc[49, [CONTRACT_COL, PHONE_COL]] = ["1234566789", normalize_phone("+393478933194")]
+        if table.num_rows > 49:
+            cols[CONTRACT_COL][49] = "1234566789"
+            cols[PHONE_COL][49] = normalize_phone("+393478933194")
+
+        # Invalid values stay in the maps as None: only those records answer with a 500
+        for col, values in field_values.items():
+            invalid = [cols[CONTRACT_COL][i] for i, value in enumerate(values) if value is None]
+            if invalid:
+                logger.warning(f"Invalid {col} for contracts: {', '.join(invalid)}")
 
-        # Build lookup indices
-        phone_idx = {val: idx for idx, val in enumerate(df[PHONE_COL])}
-        contract_idx = {val: idx for idx, val in enumerate(df[CONTRACT_COL])}
+        # Materialize rows as plain dicts: requests are served straight from these maps
+        records = [dict(zip(names, row)) for row in zip(*cols.values())]
+        phone_map = _with_phone_variants(dict(zip(cols[PHONE_COL], records)))
+        contract_map = dict(zip(cols[CONTRACT_COL], records))
 
-        return df, phone_idx, contract_idx
+        values_by_contract = {col: dict(zip(cols[CONTRACT_COL], v)) for col, v in field_values.items()}
+        values_by_phone = {col: _with_phone_variants(dict(zip(cols[PHONE_COL], v))) for col, v in field_values.items()}
+
+        return phone_map, contract_map, values_by_contract, values_by_phone, frozenset(names)
     except FileNotFoundError:
         raise RuntimeError(f"CSV file not found at {CSV_PATH}")
-    except pd.errors.EmptyDataError:
-        raise RuntimeError(f"CSV file at {CSV_PATH} is empty")
+    except RuntimeError:
+        raise
     except Exception as e:
         raise RuntimeError(f"Error loading data: {str(e)}")
 
 # Load data at startup
 try:
-    df, phone_idx, contract_idx = load_data()
+    DATA_VERSION, (phone_map, contract_map, values_by_contract, values_by_phone, ALL_COLS) = load_data()
 except Exception as e:
     logger.error(f"Failed to load data: {e}")
     raise
 
+# Variants point at the same records, so the distinct record phones are the canonical keys
+N_CANONICAL_PHONES = len({rec[PHONE_COL] for rec in phone_map.values()})
 
-def slice_row(rec: pd.Series, cols: List[str]) -> Dict[str, Any]:
-    """Pick only the requested columns that actually exist in the record."""
-    return {c: rec[c] for c in cols if c in rec}
-
-# ── FLASK APP ───────────────────────────────────────────────────────────────
-app = Flask(__name__)
-CORS(app)  # Per demo, consenti tutte le origini
-
-# Logging requests
-@app.before_request
-def log_request():
-    logger.info(f"Request: {request.method} {request.url}")
 
-# Error handlers
-@app.errorhandler(404)
-def not_found(error):
-    return jsonify({'detail': error.description}), 404
+@lru_cache(maxsize=256)
+def _parse_fields(fields: str) -> Tuple[str, ...]:
+    """Parse the `fields` query parameter (empty -> DEFAULT_FIELDS), cached per distinct value."""
+    return tuple(fields.split(",")) if fields else tuple(DEFAULT_FIELDS)
 
-@app.errorhandler(500)
-def internal_error(error):
-    logger.error(f"Internal server error: {error}")
-    return jsonify({'detail': 'Internal server error'}), 500
+def slice_row(rec: Dict[str, str], cols: Iterable[str]) -> Dict[str, Any]:
+    """Pick only the requested columns that actually exist in the CSV."""
+    return {c: rec[c] for c in cols if c in ALL_COLS}
 
-@app.route('/customer/phone/<phone>', methods=['GET'])
-def get_by_phone(phone: str):
-    # Normalize input phone
-    normalized_phone = normalize_phone(phone)
+class ORJSONResponse(Response):
+    """JSON response encoded with orjson."""
+    media_type = "application/json"
 
-    if normalized_phone not in phone_idx:
-        abort(404, description=f"Phone number not found: {normalized_phone}")
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
 
-    try:
-        rec = df.loc[phone_idx[normalized_phone]]
-        fields = request.args.get('fields')
-        wanted = fields.split(",") if fields else DEFAULT_FIELDS
-        return jsonify({'data': slice_row(rec, wanted)})
-    except Exception as e:
-        logger.error(f"Error retrieving data for {normalized_phone}: {e}")
-        abort(500, description="Internal error retrieving phone data")
+def _record_payload(rec: Dict[str, str], fields: str) -> bytes:
+    """Serialize the requested columns of a record as the `{'data': ...}` JSON body."""
+    return orjson.dumps({'data': slice_row(rec, _parse_fields(fields))}, option=orjson.OPT_SORT_KEYS)
 
-@app.route('/customer/contract/<contract_code>', methods=['GET'])
-def get_by_contract(contract_code: str):
-    if not contract_code:
-        abort(400, description="Contract code is required")
-    if contract_code not in contract_idx:
-        abort(404, description="Contract code not found")
-    try:
-        rec = df.loc[contract_idx[contract_code]]
-        fields = request.args.get('fields')
-        wanted = fields.split(",") if fields else DEFAULT_FIELDS
-        return jsonify({'data': slice_row(rec, wanted)})
-    except Exception as e:
-        logger.error(f"Error retrieving data for contract {contract_code}: {e}")
-        abort(500, description="Internal error retrieving contract data")
-@app.route('/customer/numTec/<contract_code>', methods=['GET'])
-def get_num_tec(contract_code: str):
-    if contract_code not in contract_idx:
-        abort(404, description="Contract code not found")
-    try:
-        rec = df.loc[contract_idx[contract_code]]
-        value = int(rec.get("num_contact_tec", 0))
-        return jsonify({'num_contact_tec': value})
-    except Exception as e:
-        logger.error(f"Error retrieving numTec for {contract_code}: {e}")
-        abort(500, description="Internal error retrieving numTec")
+# The data is static after load, so bodies are memoized per (key, fields)
+@lru_cache(maxsize=4096)
+def _phone_payload(phone: str, fields: str) -> Optional[bytes]:
+    rec = phone_map.get(phone)
+    return None if rec is None else _record_payload(rec, fields)
 
-@app.route('/customer/numAmm/<contract_code>', methods=['GET'])
-def get_num_amm(contract_code: str):
-    if contract_code not in contract_idx:
-        abort(404, description="Contract code not found")
-    try:
-        rec = df.loc[contract_idx[contract_code]]
-        value = int(rec.get("num_contact_amm", 0))
-        return jsonify({'num_contact_amm': value})
-    except Exception as e:
-        logger.error(f"Error retrieving numAmm for {contract_code}: {e}")
-        abort(500, description="Internal error retrieving numAmm")
+@lru_cache(maxsize=4096)
+def _contract_payload(contract_code: str, fields: str) -> Optional[bytes]:
+    rec = contract_map.get(contract_code)
+    return None if rec is None else _record_payload(rec, fields)
 
-@app.route('/customer/wifiActive/<contract_code>', methods=['GET'])
-def get_wifi_active(contract_code: str):
-    if contract_code not in contract_idx:
-        abort(404, description="Contract code not found")
-    try:
-        rec = df.loc[contract_idx[contract_code]]
-        value = int(rec.get("bb_active", 0))
-        return jsonify({'bb_active': value})
-    except Exception as e:
-        logger.error(f"Error retrieving wifiActive for {contract_code}: {e}")
-        abort(500, description="Internal error retrieving wifiActive")
+# ── HTTP CACHING ───────────────────────────────────────────────────────────────
+# Data version: changes whenever the CSV (or the config the maps were built with) changes
+ETAG_BASE = hashlib.blake2b(repr(DATA_VERSION).encode(), digest_size=8).hexdigest()
+CACHE_CONTROL = f"public, max-age={CACHE_MAX_AGE}, immutable"
 
-@app.route('/customer/userName/<contract_code>', methods=['GET'])
-def get_user_name(contract_code: str):
-    if contract_code not in contract_idx:
-        abort(404, description="Contract code not found")
-    try:
-        rec = df.loc[contract_idx[contract_code]]
-        value = rec.get("user_name", "")
-        return jsonify({'user_name': value})
-    except Exception as e:
-        logger.error(f"Error retrieving userName for {contract_code}: {e}")
-        abort(500, description="Internal error retrieving userName")
+View = Callable[[Request], Awaitable[Response]]
+_MISSING = object()
 
+def _etag(request: Request) -> str:
+    """Strong ETag for the request URL: same data version and same path/query -> same body."""
+    url = request.url
+    return '"' + hashlib.blake2b(f"{ETAG_BASE}:{url.path}?{url.query}".encode(), digest_size=16).hexdigest() + '"'
 
-@app.route('/phone/numTec/<phone>', methods=['GET'])
-def get_num_tec_by_phone(phone: str):
-    normalized_phone = normalize_phone(phone)
-    if normalized_phone not in phone_idx:
-        abort(404, description="Phone number not found")
-    try:
-        rec = df.loc[phone_idx[normalized_phone]]
-        value = int(rec.get("num_contact_tec", 0))
-        return jsonify({'num_contact_tec': value})
-    except Exception as e:
-        logger.error(f"Error retrieving numTec for phone {normalized_phone}: {e}")
-        abort(500, description="Internal error retrieving numTec")
-
-@app.route('/phone/numAmm/<phone>', methods=['GET'])
-def get_num_amm_by_phone(phone: str):
-    normalized_phone = normalize_phone(phone)
-    if normalized_phone not in phone_idx:
-        abort(404, description="Phone number not found")
-    try:
-        rec = df.loc[phone_idx[normalized_phone]]
-        value = int(rec.get("num_contact_amm", 0))
-        return jsonify({'num_contact_amm': value})
-    except Exception as e:
-        logger.error(f"Error retrieving numAmm for phone {normalized_phone}: {e}")
-        abort(500, description="Internal error retrieving numAmm")
-
-@app.route('/phone/wifiActive/<phone>', methods=['GET'])
-def get_wifi_active_by_phone(phone: str):
-    normalized_phone = normalize_phone(phone)
-    if normalized_phone not in phone_idx:
-        abort(404, description="Phone number not found")
-    try:
-        rec = df.loc[phone_idx[normalized_phone]]
-        value = int(rec.get("bb_active", 0))
-        return jsonify({'bb_active': value})
-    except Exception as e:
-        logger.error(f"Error retrieving wifiActive for phone {normalized_phone}: {e}")
-        abort(500, description="Internal error retrieving wifiActive")
-
-@app.route('/phone/userName/<phone>', methods=['GET'])
-def get_user_name_by_phone(phone: str):
-    normalized_phone = normalize_phone(phone)
-    if normalized_phone not in phone_idx:
-        abort(404, description="Phone number not found")
-    try:
-        rec = df.loc[phone_idx[normalized_phone]]
-        value = rec.get("user_name", "")
-        return jsonify({'user_name': value})
-    except Exception as e:
-        logger.error(f"Error retrieving userName for phone {normalized_phone}: {e}")
-        abort(500, description="Internal error retrieving userName")
+def _if_none_match(request: Request) -> FrozenSet[str]:
+    """Entity tags listed in `If-None-Match` (weak prefix dropped, `*` kept as is)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return frozenset()
+    return frozenset(tag.strip().removeprefix("W/") for tag in header.split(","))
 
+def cacheable(view: View) -> View:
+    """
+    Mark a lookup view's successful responses as cacheable by browsers/CDNs, and answer
+    revalidations (`If-None-Match`) with 304: before running the view on an exact tag match,
+    after it for `*`.
+    """
+    @wraps(view)
+    async def wrapper(request: Request) -> Response:
+        etag = _etag(request)
+        if_none_match = _if_none_match(request)
+        headers = {'ETag': etag, 'Cache-Control': CACHE_CONTROL}
+        if etag in if_none_match:
+            return Response(status_code=304, headers=headers)
+        response = await view(request)
+        if response.status_code != 200:
+            return response
+        # `*` only matches an existing representation: decided after the view found the key
+        if "*" in if_none_match:
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+        return response
+    return wrapper
+
+# ── STARLETTE APP ─────────────────────────────────────────────────────────────
+# Request logging is left to the server's access log (gunicorn `accesslog` / uvicorn)
 
-
-@app.route('/debug/phones', methods=['GET'])
-def list_phones():
-    return jsonify(list(phone_idx.keys())[:20])
-
-@app.route('/')
-def home():
-    return 'API is running', 200
+# Error handlers
+async def http_error(request: Request, exc: HTTPException) -> Response:
+    return ORJSONResponse({'detail': exc.detail}, status_code=exc.status_code, headers=exc.headers)
+
+async def internal_error(request: Request, exc: Exception) -> Response:
+    logger.error(f"Internal server error: {exc}")
+    return ORJSONResponse({'detail': 'Internal server error'}, status_code=500)
+
+@cacheable
+async def get_by_phone(request: Request) -> Response:
+    phone = request.path_params['phone']
+    fields = request.query_params.get('fields') or ""
+
+    # The index already holds the +39/39/0039 forms: normalize only on a miss (spaces, dashes, ...)
+    body = _phone_payload(phone, fields)
+    if body is None:
+        normalized_phone = normalize_phone(phone)
+        body = _phone_payload(normalized_phone, fields)
+        if body is None:
+            raise HTTPException(404, detail=f"Phone number not found: {normalized_phone}")
+    return Response(body, media_type='application/json')
+
+@cacheable
+async def get_by_contract(request: Request) -> Response:
+    contract_code = request.path_params['contract_code']
+    if not contract_code:
+        raise HTTPException(400, detail="Contract code is required")
+    body = _contract_payload(contract_code, request.query_params.get('fields') or "")
+    if body is None:
+        raise HTTPException(404, detail="Contract code not found")
+    return Response(body, media_type='application/json')
+
+# Single-field endpoints: (route, column, endpoint name) -> /customer/<route>/<contract_code>, /phone/<route>/<phone>
+SINGLE_FIELD_ROUTES = [
+    ("numTec", "num_contact_tec", "get_num_tec"),
+    ("numAmm", "num_contact_amm", "get_num_amm"),
+    ("wifiActive", "bb_active", "get_wifi_active"),
+    ("userName", "user_name", "get_user_name"),
+]
+
+def _make_lookup(key_map: Dict[str, Any], response_field: str, not_found: str,
+                 normalize: Optional[Callable[[str], str]] = None) -> View:
+    """Build a view answering `{response_field: value}` straight from a precomputed key -> value map."""
+    @cacheable
+    async def view(request: Request) -> Response:
+        key = request.path_params['key']
+        value = key_map.get(key, _MISSING)
+        if value is _MISSING and normalize:
+            value = key_map.get(normalize(key), _MISSING)
+        if value is _MISSING:
+            raise HTTPException(404, detail=not_found)
+        if value is None:
+            logger.error(f"Invalid {response_field} for {key}")
+            raise HTTPException(500, detail="Internal server error")
+        return ORJSONResponse({response_field: value})
+    return view
+
+async def list_phones(request: Request) -> Response:
+    # Canonical phones come first in phone_map, ahead of the +39/39/0039 variants
+    return ORJSONResponse(list(islice(phone_map, min(20, N_CANONICAL_PHONES))))
+
+async def home(request: Request) -> Response:
+    return PlainTextResponse('API is running')
+
+routes = [
+    Route('/customer/phone/{phone}', get_by_phone, methods=['GET']),
+    Route('/customer/contract/{contract_code}', get_by_contract, methods=['GET']),
+]
+for route, col, endpoint in SINGLE_FIELD_ROUTES:
+    routes.append(Route(f'/customer/{route}/{{key}}', name=endpoint, methods=['GET'],
+                        endpoint=_make_lookup(values_by_contract[col], col, "Contract code not found")))
+    routes.append(Route(f'/phone/{route}/{{key}}', name=f"{endpoint}_by_phone", methods=['GET'],
+                        endpoint=_make_lookup(values_by_phone[col], col, "Phone number not found", normalize_phone)))
+routes += [
+    Route('/debug/phones', list_phones, methods=['GET']),
+    Route('/', home),
+]
+
+app = Starlette(
+    routes=routes,
+    middleware=[
+        # Per demo, consenti tutte le origini
+        Middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"]),
+    ],
+    exception_handlers={HTTPException: http_error, Exception: internal_error},
+)
 
 if __name__ == '__main__':
+    # Solo per sviluppo locale: in produzione usare gunicorn (vedi gunicorn.conf.py)
+    import uvicorn
+
     port = int(os.environ.get("PORT", 5000))
-    app.run(host='0.0.0.0', port=port, debug=True)
+    uvicorn.run(app, host='0.0.0.0', port=port)
@@ -0,0 +1,22 @@
+import gc
+import multiprocessing
+import os
+
+# ── GUNICORN CONFIG ──────────────────────────────────────────────────────────
+# Avvio: gunicorn app:app (questo file viene letto automaticamente)
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+# ASGI workers: uvicorn picks uvloop and httptools when installed (uvicorn[standard])
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Load the CSV maps once in the master: workers share them copy-on-write after fork
+preload_app = True
+
+# Request logging (the app itself does not log per request)
+accesslog = "-"
+
+
+def when_ready(server):
+    # Move the preloaded maps to the permanent GC generation: collections in the workers
+    # no longer write to their object headers, so the shared pages stay shared
+    gc.freeze()
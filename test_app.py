@@ -0,0 +1,36 @@
+import os
+from pathlib import Path
+
+os.environ.setdefault("CSV_PATH", str(Path(__file__).with_name("nlpearl_test_db.csv")))
+
+import app  # noqa: E402
+
+# num_contact_tec cell -> value served by /customer/numTec (None -> 500, as with the per-request int())
+INT_CASES = {
+    "+3": 3,
+    "-2": -2,
+    " 7 ": 7,
+    "": 0,
+    "9223372036854775807": 9223372036854775807,
+    "9999999999999999999": 9999999999999999999,
+    "x": None,
+    "+-1": None,
+    "1.0": None,
+}
+
+
+def test_parse_csv_int_cells(tmp_path, monkeypatch):
+    cols = [app.PHONE_COL] + [c for c in app.DEFAULT_FIELDS if c != app.PHONE_COL]
+    rows = []
+    for i, cell in enumerate(INT_CASES):
+        row = {c: "0" for c in cols}
+        row.update({app.CONTRACT_COL: f"C{i}", app.PHONE_COL: f"+39340000000{i}", "num_contact_tec": cell})
+        rows.append(";".join(row[c] for c in cols))
+    csv_path = tmp_path / "ints.csv"
+    csv_path.write_text(";".join(cols) + "\n" + "\n".join(rows) + "\n", encoding="utf-8")
+    monkeypatch.setattr(app, "CSV_PATH", str(csv_path))
+
+    _, _, values_by_contract, _, _ = app._parse_csv()
+
+    served = values_by_contract["num_contact_tec"]
+    assert [served[f"C{i}"] for i in range(len(INT_CASES))] == list(INT_CASES.values())